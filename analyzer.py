@@ -1,13 +1,33 @@
 """
 Analyzer module for calculating dividend and price metrics.
 """
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-import pandas as pd
+from datetime import datetime
+from typing import Dict, List, Optional
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+__all__ = ['DividendAnalyzer']
+
+# Calendar-accurate lookback offsets, built once per distinct period
+# (months * 30 days drifts: 6 * 30 = 180 days != 6 real months)
+_MONTH_OFFSETS: Dict[int, relativedelta] = {}
+
+
+def _month_offset(months: int) -> relativedelta:
+    """Get a cached relativedelta for a lookback of `months` months."""
+    offset = _MONTH_OFFSETS.get(months)
+    if offset is None:
+        offset = _MONTH_OFFSETS[months] = relativedelta(months=months)
+    return offset
 
 
 class DividendAnalyzer:
-    """Analyzes dividend and price data to calculate performance metrics."""
+    """Analyzes dividend and price data to calculate performance metrics.
+
+    Construction sorts and caches the data arrays, so build one analyzer
+    per ticker and reuse it for every period (prefer
+    calculate_metrics_multi over repeated calculate_metrics calls).
+    """
 
     def __init__(self, dividends: List[Dict], prices: List[Dict]):
         """
@@ -22,22 +42,51 @@ class DividendAnalyzer:
         self._prepare_data()
 
     def _prepare_data(self):
-        """Prepare dataframes from raw data."""
-        # Convert prices to dataframe
+        """Prepare sorted parallel arrays from raw data.
+
+        The per-ticker payloads are small enough that DataFrame
+        construction would dominate, so the raw records are kept as
+        plain NumPy arrays (timestamps and values side by side).
+        """
+        # Convert prices to sorted parallel arrays
         if self.prices:
-            self.prices_df = pd.DataFrame(self.prices)
-            self.prices_df['date'] = pd.to_datetime(self.prices_df['t'], unit='ms')
-            self.prices_df = self.prices_df.sort_values('date')
+            ts = np.fromiter((p['t'] for p in self.prices),
+                             dtype=np.int64, count=len(self.prices))
+            closes = np.fromiter((p['c'] for p in self.prices),
+                                 dtype=np.float64, count=len(self.prices))
+            order = np.argsort(ts, kind='stable')
+            self._dates = ts[order].astype('datetime64[ms]').astype('datetime64[ns]')
+            self._closes = closes[order]
         else:
-            self.prices_df = pd.DataFrame()
+            self._dates = np.array([], dtype='datetime64[ns]')
+            self._closes = np.array([], dtype=float)
 
-        # Convert dividends to dataframe
+        # Convert dividends to sorted parallel arrays
         if self.dividends:
-            self.dividends_df = pd.DataFrame(self.dividends)
-            self.dividends_df['date'] = pd.to_datetime(self.dividends_df['ex_dividend_date'])
-            self.dividends_df = self.dividends_df.sort_values('date')
+            div_dates = np.array(
+                [d['ex_dividend_date'] for d in self.dividends],
+                dtype='datetime64[D]'
+            ).astype('datetime64[ns]')
+            amounts = np.fromiter((d['cash_amount'] for d in self.dividends),
+                                  dtype=np.float64, count=len(self.dividends))
+            order = np.argsort(div_dates, kind='stable')
+            self._div_dates = div_dates[order]
+            self._div_amounts = amounts[order]
+        else:
+            self._div_dates = np.array([], dtype='datetime64[ns]')
+            self._div_amounts = np.array([], dtype=float)
+
+        # Cache end-of-series values shared by every period calculation
+        if self._dates.size:
+            self._end_date = self._dates[-1]
+            self._end_dt = self._end_date.astype('datetime64[ms]').item()
+            self._end_price = float(self._closes[-1])
+            self._end_date_str = str(self._end_date.astype('datetime64[D]'))
         else:
-            self.dividends_df = pd.DataFrame()
+            self._end_date = None
+            self._end_dt = None
+            self._end_price = None
+            self._end_date_str = None
 
     def get_price_at_date(self, target_date: datetime) -> Optional[float]:
         """
@@ -49,15 +98,16 @@ class DividendAnalyzer:
         Returns:
             Closing price or None if not available
         """
-        if self.prices_df.empty:
+        if self._dates.size == 0:
             return None
 
-        # Find the closest date on or before target_date
-        valid_prices = self.prices_df[self.prices_df['date'] <= target_date]
-        if valid_prices.empty:
+        # Binary search for the closest date on or before target_date
+        target_np = np.datetime64(target_date, 'ns')
+        idx = np.searchsorted(self._dates, target_np, side='right') - 1
+        if idx < 0:
             return None
 
-        return valid_prices.iloc[-1]['c']  # 'c' is close price
+        return float(self._closes[idx])  # 'c' is close price
 
     def get_dividends_in_period(self, start_date: datetime, end_date: datetime) -> float:
         """
@@ -70,15 +120,16 @@ class DividendAnalyzer:
         Returns:
             Total dividend amount
         """
-        if self.dividends_df.empty:
+        if self._div_dates.size == 0:
             return 0.0
 
-        period_divs = self.dividends_df[
-            (self.dividends_df['date'] >= start_date) &
-            (self.dividends_df['date'] <= end_date)
-        ]
+        # Binary search both ends of the period instead of masking twice
+        start_np = np.datetime64(start_date, 'ns')
+        end_np = np.datetime64(end_date, 'ns')
+        lo = np.searchsorted(self._div_dates, start_np, side='left')
+        hi = np.searchsorted(self._div_dates, end_np, side='right')
 
-        return period_divs['cash_amount'].sum() if not period_divs.empty else 0.0
+        return float(self._div_amounts[lo:hi].sum()) if hi > lo else 0.0
 
     def calculate_metrics(self, months: int = 6) -> Dict:
         """
@@ -90,7 +141,7 @@ class DividendAnalyzer:
         Returns:
             Dictionary with metrics
         """
-        if self.prices_df.empty:
+        if self._dates.size == 0:
             return {
                 'period_months': months,
                 'start_date': None,
@@ -107,19 +158,19 @@ class DividendAnalyzer:
                 'profitable_total': None
             }
 
-        # Get date range
-        end_date = self.prices_df['date'].max()
-        start_date = end_date - timedelta(days=months * 30)
+        # Get date range (calendar months, not a 30-day approximation)
+        start_date = np.datetime64(self._end_dt - _month_offset(months), 'ns')
+        start_date_str = str(start_date.astype('datetime64[D]'))
 
         # Get prices
         start_price = self.get_price_at_date(start_date)
-        end_price = self.get_price_at_date(end_date)
+        end_price = self._end_price
 
         if start_price is None or end_price is None:
             return {
                 'period_months': months,
-                'start_date': start_date.strftime('%Y-%m-%d') if start_date else None,
-                'end_date': end_date.strftime('%Y-%m-%d') if end_date else None,
+                'start_date': start_date_str,
+                'end_date': self._end_date_str,
                 'start_price': start_price,
                 'end_price': end_price,
                 'price_change': None,
@@ -137,7 +188,7 @@ class DividendAnalyzer:
         price_change_pct = (price_change / start_price) * 100
 
         # Calculate dividends
-        total_dividends = self.get_dividends_in_period(start_date, end_date)
+        total_dividends = self.get_dividends_in_period(start_date, self._end_date)
         dividend_yield_pct = (total_dividends / start_price) * 100
 
         # Calculate total return
@@ -146,8 +197,8 @@ class DividendAnalyzer:
 
         return {
             'period_months': months,
-            'start_date': start_date.strftime('%Y-%m-%d'),
-            'end_date': end_date.strftime('%Y-%m-%d'),
+            'start_date': start_date_str,
+            'end_date': self._end_date_str,
             'start_price': round(start_price, 2),
             'end_price': round(end_price, 2),
             'price_change': round(price_change, 2),
@@ -160,7 +211,87 @@ class DividendAnalyzer:
             'profitable_total': total_return > 0
         }
 
-    def get_price_history(self, months: int = 12) -> List[Tuple[str, float]]:
+    def calculate_metrics_multi(self, months_list: List[int]) -> Dict[int, Dict]:
+        """
+        Calculate performance metrics for several periods in one pass.
+
+        Shares the cached end-of-series values and batches the start-price
+        and dividend-sum lookups with a single searchsorted call each,
+        instead of repeating the per-period work in calculate_metrics.
+
+        Args:
+            months_list: Periods to calculate, in months
+
+        Returns:
+            Dictionary mapping each period (months) to its metrics dictionary
+        """
+        if self._dates.size == 0:
+            return {months: self.calculate_metrics(months) for months in months_list}
+
+        # Batch the start-date lookups across all periods
+        start_np = np.array(
+            [self._end_dt - _month_offset(months) for months in months_list],
+            dtype='datetime64[ns]'
+        )
+        start_idx = np.searchsorted(self._dates, start_np, side='right') - 1
+
+        # Batch the dividend sums via cumulative sum bracketed by searchsorted
+        if self._div_dates.size:
+            div_cumsum = np.concatenate(([0.0], np.cumsum(self._div_amounts)))
+            lo = np.searchsorted(self._div_dates, start_np, side='left')
+            hi = np.searchsorted(self._div_dates, self._end_date, side='right')
+            div_totals = div_cumsum[hi] - div_cumsum[lo]
+        else:
+            div_totals = np.zeros(len(months_list))
+
+        results = {}
+        for i, months in enumerate(months_list):
+            start_date_str = str(start_np[i].astype('datetime64[D]'))
+            if start_idx[i] < 0:
+                results[months] = {
+                    'period_months': months,
+                    'start_date': start_date_str,
+                    'end_date': self._end_date_str,
+                    'start_price': None,
+                    'end_price': self._end_price,
+                    'price_change': None,
+                    'price_change_pct': None,
+                    'total_dividends': None,
+                    'dividend_yield_pct': None,
+                    'total_return': None,
+                    'total_return_pct': None,
+                    'profitable_price': None,
+                    'profitable_total': None
+                }
+                continue
+
+            start_price = float(self._closes[start_idx[i]])
+            price_change = self._end_price - start_price
+            price_change_pct = (price_change / start_price) * 100
+            total_dividends = float(div_totals[i])
+            dividend_yield_pct = (total_dividends / start_price) * 100
+            total_return = price_change + total_dividends
+            total_return_pct = (total_return / start_price) * 100
+
+            results[months] = {
+                'period_months': months,
+                'start_date': start_date_str,
+                'end_date': self._end_date_str,
+                'start_price': round(start_price, 2),
+                'end_price': round(self._end_price, 2),
+                'price_change': round(price_change, 2),
+                'price_change_pct': round(price_change_pct, 2),
+                'total_dividends': round(total_dividends, 2),
+                'dividend_yield_pct': round(dividend_yield_pct, 2),
+                'total_return': round(total_return, 2),
+                'total_return_pct': round(total_return_pct, 2),
+                'profitable_price': price_change > 0,
+                'profitable_total': total_return > 0
+            }
+
+        return results
+
+    def get_price_history(self, months: int = 12) -> List[List]:
         """
         Get price history for the specified period.
 
@@ -168,20 +299,21 @@ class DividendAnalyzer:
             months: Number of months to look back
 
         Returns:
-            List of (date, close_price) tuples
+            List of [date, close_price] pairs
         """
-        if self.prices_df.empty:
+        if self._dates.size == 0:
             return []
 
-        end_date = self.prices_df['date'].max()
-        start_date = end_date - timedelta(days=months * 30)
+        start_date = np.datetime64(self._end_dt - _month_offset(months), 'ns')
 
-        period_prices = self.prices_df[self.prices_df['date'] >= start_date]
+        # Slice the cached sorted arrays and format all dates in one call.
+        # Pairs are lists, not tuples, so results round-trip unchanged
+        # through the JSON result cache.
+        lo = np.searchsorted(self._dates, start_date, side='left')
+        dates = np.datetime_as_string(self._dates[lo:], unit='D')
+        closes = self._closes[lo:]
 
-        return [
-            (row['date'].strftime('%Y-%m-%d'), row['c'])
-            for _, row in period_prices.iterrows()
-        ]
+        return [list(pair) for pair in zip(dates.tolist(), closes.tolist())]
 
     def get_dividend_frequency(self) -> str:
         """
@@ -190,25 +322,24 @@ class DividendAnalyzer:
         Returns:
             'M' for monthly, 'Q' for quarterly, 'W' for weekly, or '' if unknown
         """
-        if self.dividends_df.empty or len(self.dividends_df) < 2:
+        if self._div_dates.size < 2:
             return ''
 
         # Get dividends from last 12 months
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)
-        recent_divs = self.dividends_df[self.dividends_df['date'] >= start_date]
+        cutoff = np.datetime64(datetime.now() - _month_offset(12), 'ns')
+        lo = np.searchsorted(self._div_dates, cutoff, side='left')
+        recent_dates = self._div_dates[lo:]
 
-        if len(recent_divs) < 2:
+        if recent_dates.size < 2:
             return ''
 
-        # Calculate average days between dividends
-        dates = sorted(recent_divs['date'].tolist())
-        intervals = [(dates[i+1] - dates[i]).days for i in range(len(dates)-1)]
+        # Calculate average days between dividends (array is already sorted)
+        intervals_ns = np.diff(recent_dates.view('i8'))
 
-        if not intervals:
+        if intervals_ns.size == 0:
             return ''
 
-        avg_interval = sum(intervals) / len(intervals)
+        avg_interval = intervals_ns.mean() / 86_400_000_000_000  # ns per day
 
         # Classify based on average interval
         if avg_interval <= 10:  # ~weekly (7 days, with some buffer)
@@ -4,43 +4,72 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
+from data_manager import write_json
 from report_data import collect_report_data
 
 PERIODS: Iterable[str] = ("3m", "6m", "12m")
 GLOBAL_DATA_VAR = "__DIVIDEND_DASHBOARD__"
 
 
+def _coerce_int(value: Any) -> Any:
+    return None if value is None else int(value)
+
+
+def _coerce_str(value: Any) -> Any:
+    return None if value is None else str(value)
+
+
+def _coerce_bool(value: Any) -> Any:
+    return None if value is None else bool(value)
+
+
+def _coerce_float(value: Any) -> Any:
+    return None if value is None else round(float(value), 6)
+
+
+def _coerce_other(value: Any) -> Any:
+    """Fallback for keys outside the known metrics schema."""
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    try:
+        return round(float(value), 6)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+# The metrics schema is fixed (see DividendAnalyzer.calculate_metrics), so
+# dispatch per key instead of re-running an isinstance ladder per value.
+_METRIC_COERCERS: Dict[str, Any] = {
+    "period_months": _coerce_int,
+    "start_date": _coerce_str,
+    "end_date": _coerce_str,
+    "start_price": _coerce_float,
+    "end_price": _coerce_float,
+    "price_change": _coerce_float,
+    "price_change_pct": _coerce_float,
+    "total_dividends": _coerce_float,
+    "dividend_yield_pct": _coerce_float,
+    "total_return": _coerce_float,
+    "total_return_pct": _coerce_float,
+    "profitable_price": _coerce_bool,
+    "profitable_total": _coerce_bool,
+}
+
+
 def clean_metrics(metrics: Dict[str, Any] | None) -> Dict[str, Any]:
     """Convert metrics to JSON-serialisable primitives."""
     if not metrics:
         return {}
 
-    cleaned: Dict[str, Any] = {}
-    for key, value in metrics.items():
-        if value is None:
-            cleaned[key] = None
-            continue
-
-        if key.startswith("profitable_"):
-            cleaned[key] = bool(value)
-            continue
-
-        if isinstance(value, bool):
-            cleaned[key] = bool(value)
-        elif isinstance(value, (int, str)):
-            cleaned[key] = value
-        elif isinstance(value, float):
-            cleaned[key] = round(float(value), 6)
-        else:
-            try:
-                cleaned[key] = float(value)
-            except (TypeError, ValueError):
-                cleaned[key] = str(value)
-    return cleaned
+    return {
+        key: _METRIC_COERCERS.get(key, _coerce_other)(value)
+        for key, value in metrics.items()
+    }
 
 
 def transform_table_data(table_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -79,41 +108,109 @@ def transform_table_data(table_data: List[Dict[str, Any]]) -> List[Dict[str, Any
     return transformed
 
 
-def copy_static_assets(static_dir: Path, output_dir: Path) -> None:
-    """Copy static dashboard assets to the build directory."""
+# Build outputs generated from report data rather than static sources
+GENERATED_FILES = ("assets/data.json", "assets/data.js")
+
+
+def _place_file(source: Path, destination: Path, use_hardlinks: bool) -> None:
+    """Hardlink a file into the build tree, falling back to a plain copy."""
+    if destination.exists():
+        if destination.stat().st_mtime_ns >= source.stat().st_mtime_ns:
+            return  # already up to date
+        destination.unlink()
+    if use_hardlinks:
+        try:
+            os.link(source, destination)
+            return
+        except OSError:
+            # Cross-device link or unsupported filesystem; copy instead
+            pass
+    shutil.copyfile(source, destination)
+
+
+def copy_static_assets(static_dir: Path, output_dir: Path,
+                       use_hardlinks: bool = True) -> None:
+    """Copy static dashboard assets to the build directory.
+
+    Static assets never change during a build, so hardlinks (zero-copy,
+    O(1)) are preferred over full read+write copies when the filesystem
+    allows it, and files that are already up to date are left alone.
+    GENERATED_FILES are skipped: they are build outputs, and linking
+    their checked-in placeholders would let the data writers reach back
+    into the source tree.
+    """
     if not static_dir.exists():
         raise FileNotFoundError(f"Static assets directory not found: {static_dir}")
 
+    generated = {Path(rel) for rel in GENERATED_FILES}
+
     for entry in static_dir.iterdir():
         destination = output_dir / entry.name
         if entry.is_dir():
-            shutil.copytree(entry, destination)
-        else:
-            shutil.copy2(entry, destination)
+            for root, _dirs, files in os.walk(entry):
+                root_path = Path(root)
+                target_root = destination / root_path.relative_to(entry)
+                target_root.mkdir(parents=True, exist_ok=True)
+                for name in files:
+                    source = root_path / name
+                    if source.relative_to(static_dir) in generated:
+                        continue  # regenerated from report data below
+                    _place_file(source, target_root / name, use_hardlinks)
+        elif entry.relative_to(static_dir) not in generated:
+            _place_file(entry, destination, use_hardlinks)
+
+
+def prune_stale_outputs(static_dir: Path, output_dir: Path) -> None:
+    """Remove build outputs whose source file no longer exists."""
+    keep = {Path(rel) for rel in GENERATED_FILES}
+    for root, _dirs, files in os.walk(static_dir):
+        root_path = Path(root)
+        for name in files:
+            keep.add((root_path / name).relative_to(static_dir))
+
+    # Deepest entries first so emptied directories can be removed
+    for path in sorted(output_dir.rglob("*"), reverse=True):
+        if path.is_file():
+            if path.relative_to(output_dir) not in keep:
+                path.unlink()
+        elif path.is_dir():
+            try:
+                path.rmdir()
+            except OSError:
+                pass  # still has surviving children
 
 
-def write_data_file(output_dir: Path, payload: Dict[str, Any]) -> Path:
+def write_data_file(output_dir: Path, payload: Dict[str, Any], pretty: bool = False) -> Path:
     assets_dir = output_dir / "assets"
     assets_dir.mkdir(exist_ok=True)
     data_path = assets_dir / "data.json"
-    with data_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-        handle.write("\n")
+    # Generated assets default to compact JSON: smaller, faster to emit
+    write_json(data_path, payload, pretty=pretty)
     return data_path
 
 
-def write_data_script(output_dir: Path, payload: Dict[str, Any]) -> Path:
+def write_data_script(output_dir: Path, payload: Dict[str, Any], pretty: bool = False) -> Path:
     assets_dir = output_dir / "assets"
     assets_dir.mkdir(exist_ok=True)
     script_path = assets_dir / "data.js"
-    json_blob = json.dumps(payload, ensure_ascii=False, indent=2)
-    content = f"window.{GLOBAL_DATA_VAR} = {json_blob};\n"
-    with script_path.open("w", encoding="utf-8") as handle:
-        handle.write(content)
+    # Write prefix, JSON body, and suffix separately so the serialized
+    # payload is never duplicated into one giant Python string; go via a
+    # temp file + os.replace so an existing (possibly hardlinked) file
+    # is swapped out rather than written through.
+    tmp_path = script_path.with_name(script_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        handle.write(f"window.{GLOBAL_DATA_VAR} = ")
+        if pretty:
+            json.dump(payload, handle, ensure_ascii=False, indent=2)
+        else:
+            json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+        handle.write(";\n")
+    os.replace(tmp_path, script_path)
     return script_path
 
 
-def build_dashboard(config_path: Path, static_dir: Path, output_dir: Path, silent: bool = False) -> None:
+def build_dashboard(config_path: Path, static_dir: Path, output_dir: Path,
+                    silent: bool = False, pretty: bool = False) -> None:
     table_data, metadata = collect_report_data(config_path=str(config_path), silent=silent)
 
     payload: Dict[str, Any] = {
@@ -128,13 +225,14 @@ def build_dashboard(config_path: Path, static_dir: Path, output_dir: Path, silen
         "symbols": transform_table_data(table_data),
     }
 
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
-    output_dir.mkdir(parents=True)
+    # Sync incrementally rather than wiping the whole build directory:
+    # drop orphaned outputs, refresh stale statics, regenerate data files.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    prune_stale_outputs(static_dir, output_dir)
 
     copy_static_assets(static_dir, output_dir)
-    data_file = write_data_file(output_dir, payload)
-    data_script = write_data_script(output_dir, payload)
+    data_file = write_data_file(output_dir, payload, pretty=pretty)
+    data_script = write_data_script(output_dir, payload, pretty=pretty)
 
     print(f"📦 Dashboard assets copied to: {output_dir}")
     print(f"📈 Data file generated at: {data_file}")
@@ -169,12 +267,18 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Suppress per-symbol progress logging",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the generated data files for easier debugging",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    build_dashboard(args.config, args.static_dir, args.output_dir, silent=args.quiet)
+    build_dashboard(args.config, args.static_dir, args.output_dir,
+                    silent=args.quiet, pretty=args.pretty)
 
 
 if __name__ == "__main__":
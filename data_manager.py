@@ -9,6 +9,85 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works fine
+    orjson = None
+
+try:
+    import pyarrow.parquet as pq
+    HAS_PARQUET = True
+except ImportError:  # optional: columnar storage, falls back to JSON
+    pq = None
+    HAS_PARQUET = False
+
+
+def read_json(file_path: Path) -> Any:
+    """Read a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def write_json(file_path: Path, data: Any, pretty: bool = True):
+    """Write JSON, using orjson when available.
+
+    The payload goes to a sibling temp file that is moved into place
+    with os.replace, so the write is atomic and never goes through an
+    existing inode (the destination may be hardlinked into a build
+    tree, e.g. by the web dashboard's asset sync).
+
+    Args:
+        file_path: Destination path
+        data: JSON-serializable payload
+        pretty: If True, indent with 2 spaces; otherwise emit compact JSON
+    """
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        tmp_path.write_bytes(orjson.dumps(data, option=option))
+    else:
+        with open(tmp_path, 'w') as f:
+            if pretty:
+                json.dump(data, f, indent=2)
+            else:
+                json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_path, file_path)
+
+
+def merge_sorted_records(existing: List[Dict[str, Any]],
+                         new: List[Dict[str, Any]],
+                         key: str) -> List[Dict[str, Any]]:
+    """Merge two record lists sorted on `key`; new records win on ties.
+
+    Existing data is already sorted on disk, so only the (usually short)
+    new batch needs sorting, then a single linear two-pointer pass merges
+    and dedupes without rebuilding a dict over every stored record.
+    """
+    # Dedupe the new batch (last occurrence wins, as with dict insertion)
+    new_sorted = sorted({r[key]: r for r in new}.values(), key=lambda r: r[key])
+
+    merged: List[Dict[str, Any]] = []
+    i = j = 0
+    while i < len(existing) and j < len(new_sorted):
+        existing_key = existing[i][key]
+        new_key = new_sorted[j][key]
+        if existing_key < new_key:
+            merged.append(existing[i])
+            i += 1
+        elif existing_key > new_key:
+            merged.append(new_sorted[j])
+            j += 1
+        else:
+            merged.append(new_sorted[j])
+            i += 1
+            j += 1
+    merged.extend(existing[i:])
+    merged.extend(new_sorted[j:])
+    return merged
+
 
 class DataManager:
     """Manages local storage of dividend and price data."""
@@ -30,13 +109,59 @@ class DataManager:
         self.prices_dir.mkdir(exist_ok=True)
 
     def _get_dividend_file(self, ticker: str) -> Path:
-        """Get path to dividend data file for a ticker."""
+        """Get path to legacy JSON dividend data file for a ticker."""
         return self.dividends_dir / f"{ticker}_dividends.json"
 
     def _get_price_file(self, ticker: str) -> Path:
-        """Get path to price data file for a ticker."""
+        """Get path to legacy JSON price data file for a ticker."""
         return self.prices_dir / f"{ticker}_prices.json"
 
+    def _get_dividend_parquet(self, ticker: str) -> Path:
+        """Get path to Parquet dividend data file for a ticker."""
+        return self.dividends_dir / f"{ticker}_dividends.parquet"
+
+    def _get_price_parquet(self, ticker: str) -> Path:
+        """Get path to Parquet price data file for a ticker."""
+        return self.prices_dir / f"{ticker}_prices.parquet"
+
+    def _read_records(self, parquet_path: Path, json_path: Path) -> List[Dict[str, Any]]:
+        """Load records from Parquet, falling back to a legacy JSON file."""
+        if HAS_PARQUET and parquet_path.exists():
+            # Memory-mapped read skips a copy; to_pylist keeps missing
+            # fields as None
+            table = pq.read_table(parquet_path, memory_map=True)
+            return table.to_pylist()
+        if json_path.exists():
+            return read_json(json_path)
+        return []
+
+    def _write_records(self, parquet_path: Path, json_path: Path,
+                       records: List[Dict[str, Any]]):
+        """Write records as typed columnar Parquet when available, else JSON."""
+        if HAS_PARQUET:
+            pd.DataFrame(records).to_parquet(
+                parquet_path, engine='pyarrow', compression='zstd'
+            )
+        else:
+            write_json(json_path, records)
+
+    def migrate_to_parquet(self):
+        """One-time migration of legacy JSON data files to Parquet."""
+        if not HAS_PARQUET:
+            print("pyarrow is not installed, nothing to migrate")
+            return
+
+        for directory, suffix in ((self.dividends_dir, '_dividends'),
+                                  (self.prices_dir, '_prices')):
+            for json_path in sorted(directory.glob(f"*{suffix}.json")):
+                parquet_path = json_path.with_suffix('.parquet')
+                records = read_json(json_path)
+                pd.DataFrame(records).to_parquet(
+                    parquet_path, engine='pyarrow', compression='zstd'
+                )
+                json_path.unlink()
+                print(f"Migrated {json_path.name} -> {parquet_path.name}")
+
     def save_dividends(self, ticker: str, dividends: List[Dict[str, Any]]):
         """
         Save dividend data for a ticker, merging with existing data.
@@ -45,25 +170,15 @@ class DataManager:
             ticker: Stock ticker symbol
             dividends: List of dividend records
         """
-        file_path = self._get_dividend_file(ticker)
-
         # Load existing data if available
-        existing_data = []
-        if file_path.exists():
-            with open(file_path, 'r') as f:
-                existing_data = json.load(f)
-
-        # Merge data (use ex_dividend_date as unique key)
-        existing_dict = {d['ex_dividend_date']: d for d in existing_data}
-        for div in dividends:
-            existing_dict[div['ex_dividend_date']] = div
+        existing_data = self.load_dividends(ticker)
 
-        # Sort by date
-        merged_data = sorted(existing_dict.values(), key=lambda x: x['ex_dividend_date'])
+        # Merge data (use ex_dividend_date as unique key, sorted by date)
+        merged_data = merge_sorted_records(existing_data, dividends, 'ex_dividend_date')
 
         # Save merged data
-        with open(file_path, 'w') as f:
-            json.dump(merged_data, f, indent=2)
+        self._write_records(self._get_dividend_parquet(ticker),
+                            self._get_dividend_file(ticker), merged_data)
 
         print(f"Saved {len(merged_data)} dividend records for {ticker}")
 
@@ -75,25 +190,15 @@ class DataManager:
             ticker: Stock ticker symbol
             prices: List of price bar records
         """
-        file_path = self._get_price_file(ticker)
-
         # Load existing data if available
-        existing_data = []
-        if file_path.exists():
-            with open(file_path, 'r') as f:
-                existing_data = json.load(f)
-
-        # Merge data (use timestamp as unique key)
-        existing_dict = {p['t']: p for p in existing_data}
-        for price in prices:
-            existing_dict[price['t']] = price
+        existing_data = self.load_prices(ticker)
 
-        # Sort by timestamp
-        merged_data = sorted(existing_dict.values(), key=lambda x: x['t'])
+        # Merge data (use timestamp as unique key, sorted by timestamp)
+        merged_data = merge_sorted_records(existing_data, prices, 't')
 
         # Save merged data
-        with open(file_path, 'w') as f:
-            json.dump(merged_data, f, indent=2)
+        self._write_records(self._get_price_parquet(ticker),
+                            self._get_price_file(ticker), merged_data)
 
         print(f"Saved {len(merged_data)} price records for {ticker}")
 
@@ -107,13 +212,8 @@ class DataManager:
         Returns:
             List of dividend records
         """
-        file_path = self._get_dividend_file(ticker)
-
-        if not file_path.exists():
-            return []
-
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return self._read_records(self._get_dividend_parquet(ticker),
+                                  self._get_dividend_file(ticker))
 
     def load_prices(self, ticker: str) -> List[Dict[str, Any]]:
         """
@@ -125,13 +225,27 @@ class DataManager:
         Returns:
             List of price bar records
         """
-        file_path = self._get_price_file(ticker)
+        return self._read_records(self._get_price_parquet(ticker),
+                                  self._get_price_file(ticker))
 
-        if not file_path.exists():
-            return []
+    def data_fingerprint(self, ticker: str) -> List[Optional[int]]:
+        """
+        Get a fingerprint of the on-disk data files for a ticker.
 
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            List of file mtimes (ns), None for files that do not exist.
+            Changes whenever any underlying data file changes.
+        """
+        paths = (
+            self._get_price_parquet(ticker),
+            self._get_price_file(ticker),
+            self._get_dividend_parquet(ticker),
+            self._get_dividend_file(ticker),
+        )
+        return [p.stat().st_mtime_ns if p.exists() else None for p in paths]
 
     def get_date_range(self, ticker: str, data_type: str = 'prices') -> Optional[tuple]:
         """
@@ -148,17 +262,15 @@ class DataManager:
             data = self.load_prices(ticker)
             if not data:
                 return None
-            # Convert timestamps to dates
-            start_ts = min(d['t'] for d in data)
-            end_ts = max(d['t'] for d in data)
-            start_date = datetime.fromtimestamp(start_ts / 1000).strftime('%Y-%m-%d')
-            end_date = datetime.fromtimestamp(end_ts / 1000).strftime('%Y-%m-%d')
+            # Records are stored sorted by timestamp, so the range is the ends
+            start_date = datetime.fromtimestamp(data[0]['t'] / 1000).strftime('%Y-%m-%d')
+            end_date = datetime.fromtimestamp(data[-1]['t'] / 1000).strftime('%Y-%m-%d')
             return (start_date, end_date)
         elif data_type == 'dividends':
             data = self.load_dividends(ticker)
             if not data:
                 return None
-            dates = [d['ex_dividend_date'] for d in data]
-            return (min(dates), max(dates))
+            # Records are stored sorted by ex_dividend_date
+            return (data[0]['ex_dividend_date'], data[-1]['ex_dividend_date'])
 
         return None
@@ -4,13 +4,17 @@ Main script to fetch dividend and price history from Polygon API.
 Supports incremental updates by checking existing data.
 """
 import yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from polygon_client import PolygonClient
 from data_manager import DataManager
+from symbols_util import normalize_symbols
 
 
+@lru_cache(maxsize=4)
 def load_config(config_path: str = 'config.yaml') -> dict:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file (parsed once per process)."""
     with open(config_path, 'r') as f:
         return yaml.safe_load(f)
 
@@ -34,12 +38,33 @@ def get_fetch_date_range(lookback_months: int = 24) -> tuple:
     )
 
 
+def incremental_start(full_start: str, existing_range: tuple) -> str:
+    """
+    Narrow a fetch window to only the dates missing from existing data.
+
+    Args:
+        full_start: Requested window start (YYYY-MM-DD)
+        existing_range: (start, end) of data already on disk, or None
+
+    Returns:
+        The day after the existing data ends, or full_start if there is
+        no existing data (or it starts after full_start)
+    """
+    if not existing_range:
+        return full_start
+
+    next_day = (datetime.fromisoformat(existing_range[1]) +
+                timedelta(days=1)).strftime('%Y-%m-%d')
+    return max(full_start, next_day)
+
+
 def fetch_data_for_symbol(
     client: PolygonClient,
     data_manager: DataManager,
     ticker: str,
     start_date: str,
-    end_date: str
+    end_date: str,
+    dividends: list = None
 ):
     """
     Fetch dividend and price data for a single symbol.
@@ -50,6 +75,8 @@ def fetch_data_for_symbol(
         ticker: Stock ticker symbol
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
+        dividends: Pre-fetched dividend records (from a bulk request);
+            None means fetch them here
     """
     print(f"\n{'='*60}")
     print(f"Processing {ticker}")
@@ -69,33 +96,64 @@ def fetch_data_for_symbol(
     else:
         print("No existing dividend data")
 
-    # Fetch dividends
-    print(f"\nFetching dividends from {start_date} to {end_date}...")
-    try:
-        dividends = client.get_dividends(ticker, start_date, end_date)
-        if dividends:
-            data_manager.save_dividends(ticker, dividends)
+    px_from = incremental_start(start_date, existing_price_range)
+    prices = None
+
+    # Fetch dividends (unless already supplied by the bulk request),
+    # asking only for dates newer than what is already stored
+    if dividends is None:
+        div_from = incremental_start(start_date, existing_div_range)
+        if div_from > end_date:
+            print(f"\nDividend data for {ticker} already up to date")
+            dividends = []
+        elif div_from == px_from and px_from <= end_date:
+            # Both streams need the same window (the usual case for a
+            # new symbol), so issue the two calls concurrently instead
+            # of paying two rate-limit waits back to back
+            print(f"\nFetching dividends and prices from {div_from} to {end_date}...")
+            try:
+                dividends, prices = client.fetch_symbol_bundle(
+                    ticker, div_from, end_date
+                )
+            except Exception as e:
+                print(f"Error fetching data for {ticker}: {e}")
+                dividends = []
         else:
-            print(f"No dividends found for {ticker}")
-    except Exception as e:
-        print(f"Error fetching dividends for {ticker}: {e}")
+            print(f"\nFetching dividends from {div_from} to {end_date}...")
+            try:
+                dividends = client.get_dividends(ticker, div_from, end_date)
+            except Exception as e:
+                print(f"Error fetching dividends for {ticker}: {e}")
+                dividends = []
+
+    if dividends:
+        data_manager.save_dividends(ticker, dividends)
+    else:
+        print(f"No new dividends found for {ticker}")
 
-    # Fetch prices
-    print(f"\nFetching prices from {start_date} to {end_date}...")
-    try:
-        prices = client.get_aggregates(
-            ticker,
-            multiplier=1,
-            timespan='day',
-            from_date=start_date,
-            to_date=end_date
-        )
-        if prices:
-            data_manager.save_prices(ticker, prices)
-        else:
-            print(f"No price data found for {ticker}")
-    except Exception as e:
-        print(f"Error fetching prices for {ticker}: {e}")
+    # Fetch prices, likewise only the missing tail of the window
+    if px_from > end_date:
+        print(f"\nPrice data for {ticker} already up to date")
+        return
+
+    if prices is None:
+        print(f"\nFetching prices from {px_from} to {end_date}...")
+        try:
+            prices = client.get_aggregates(
+                ticker,
+                multiplier=1,
+                timespan='day',
+                from_date=px_from,
+                to_date=end_date
+            )
+        except Exception as e:
+            print(f"Error fetching prices for {ticker}: {e}")
+            return
+
+    if prices:
+        data_manager.save_prices(ticker, prices)
+    else:
+        print(f"No new price data found for {ticker}")
 
 
 def main():
@@ -107,7 +165,8 @@ def main():
     # Initialize client and data manager
     client = PolygonClient(
         api_key=config['polygon_api_key'],
-        requests_per_minute=config['rate_limit_requests_per_minute']
+        requests_per_minute=config['rate_limit_requests_per_minute'],
+        cache_dir=f"{config['data_directory']}/.cache/polygon"
     )
     data_manager = DataManager(config['data_directory'])
 
@@ -116,15 +175,37 @@ def main():
     print(f"\nFetching data from {start_date} to {end_date}")
 
     # Process each symbol
-    symbols = config['symbols']
+    symbols, _ = normalize_symbols(config['symbols'])
     print(f"\nProcessing {len(symbols)} symbols: {', '.join(symbols)}")
 
-    for ticker in symbols:
-        try:
-            fetch_data_for_symbol(client, data_manager, ticker, start_date, end_date)
-        except Exception as e:
-            print(f"\nFailed to process {ticker}: {e}")
-            continue
+    # Fetch dividends for every symbol in one batched call; fall back to
+    # per-symbol requests if the batch fails
+    print("\nFetching dividends for all symbols in one batch...")
+    try:
+        dividends_by_symbol = client.get_dividends_bulk(symbols, start_date, end_date)
+    except Exception as e:
+        print(f"Bulk dividend fetch failed, falling back to per-symbol: {e}")
+        dividends_by_symbol = None
+
+    # Fetching is I/O-bound waiting on HTTPS, so overlap symbols with a
+    # small thread pool; the client's rate limiter paces the actual calls
+    max_workers = min(8, config['rate_limit_requests_per_minute'], len(symbols)) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                fetch_data_for_symbol, client, data_manager,
+                ticker, start_date, end_date,
+                dividends=None if dividends_by_symbol is None
+                else dividends_by_symbol.get(ticker, [])
+            ): ticker
+            for ticker in symbols
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"\nFailed to process {ticker}: {e}")
 
     print(f"\n{'='*60}")
     print("Data fetch complete!")
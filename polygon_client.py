@@ -1,10 +1,42 @@
 """
 Polygon API client with rate limiting support.
 """
+import gzip
+import hashlib
+import json
+import os
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional, List, Dict, Any
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works fine
+    orjson = None
+
+# Only advertise brotli if a decoder is installed, else stick to gzip
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+
+def _parse_response(response: requests.Response) -> Dict[str, Any]:
+    """Parse a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Cache TTLs aligned to how often the underlying data can change
+TTL_DIVIDENDS = 7 * 86400       # dividends update at most ~quarterly
+TTL_HISTORICAL_BARS = 90 * 86400  # bars for past dates are immutable
+TTL_RECENT_BARS = 3600          # windows touching today refresh hourly
 
 
 class PolygonClient:
@@ -12,35 +44,116 @@ class PolygonClient:
 
     BASE_URL = "https://api.polygon.io"
 
-    def __init__(self, api_key: str, requests_per_minute: int = 5):
+    def __init__(self, api_key: str, requests_per_minute: int = 5,
+                 cache_dir: Optional[str] = None):
         """
         Initialize Polygon API client.
 
         Args:
             api_key: Polygon API key
             requests_per_minute: Rate limit for API requests
+            cache_dir: Directory for cached API responses (None disables caching)
         """
         self.api_key = api_key
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.requests_per_minute = requests_per_minute
-        self.min_request_interval = 60.0 / requests_per_minute
-        self.last_request_time = 0
+
+        # Token bucket: allows short bursts up to requests_per_minute
+        # while keeping the long-run rate at the limit, instead of
+        # forcing a fixed sleep between any two calls
+        self._capacity = float(requests_per_minute)
+        self._tokens = float(requests_per_minute)
+        self._refill_per_sec = requests_per_minute / 60.0
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+
+        # Every call hits the same host, so keep connections alive in a
+        # pooled session instead of paying a TCP+TLS handshake per request
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Accept-Encoding": ACCEPT_ENCODING})
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
     def _rate_limit(self):
-        """Enforce rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        """Take a token from the rate-limit bucket, waiting if empty (thread-safe)."""
+        # Refill and claim under the lock so concurrent workers
+        # cooperatively pace to requests_per_minute; sleep outside it
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * self._refill_per_sec
+            )
+            self._last_refill = now
 
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                sleep_time = 0.0
+            else:
+                # Borrow the token now; sleep until the refill covers it
+                sleep_time = (1.0 - self._tokens) / self._refill_per_sec
+                self._tokens = 0.0
+                self._last_refill = now + sleep_time
+
+        if sleep_time > 0:
             print(f"Rate limiting: sleeping for {sleep_time:.2f}s")
             time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+    def _cache_path(self, endpoint: str, params: Dict[str, Any]) -> Path:
+        """Build the cache file path for a request (API key excluded)."""
+        key_source = endpoint + '?' + '&'.join(
+            f"{k}={params[k]}" for k in sorted(params)
+        )
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.json.gz"
+
+    def _cache_read(self, cache_path: Path, ttl: float) -> Optional[Dict[str, Any]]:
+        """Return a cached response if it is younger than ttl seconds."""
+        try:
+            if time.time() - cache_path.stat().st_mtime < ttl:
+                with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                    return json.load(f)
+        except (OSError, ValueError, EOFError):
+            # EOFError: truncated gzip stream from an interrupted write;
+            # treat like any other miss so the entry gets refetched
+            pass
+        return None
 
-    def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _cache_write(self, cache_path: Path, data: Dict[str, Any]):
+        """Store a response payload in the on-disk cache.
+
+        Written to a sibling temp file and moved into place with
+        os.replace so an interrupted write can never leave a truncated
+        entry behind.
+        """
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+
+    def _make_request(self, endpoint: str,
+                      params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Make a rate-limited request to Polygon API.
 
+        Caching happens in _fetch_all_results, which stores the merged
+        result set rather than individual pages.
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
@@ -48,19 +161,67 @@ class PolygonClient:
         Returns:
             JSON response as dictionary
         """
-        self._rate_limit()
-
         if params is None:
             params = {}
+
+        self._rate_limit()
+
         params['apiKey'] = self.api_key
 
         url = f"{self.BASE_URL}{endpoint}"
         print(f"Requesting: {endpoint}")
 
-        response = requests.get(url, params=params)
+        response = self._session.get(url, params=params, timeout=(3.05, 30))
         response.raise_for_status()
 
-        return response.json()
+        return _parse_response(response)
+
+    def _get_next(self, next_url: str) -> Dict[str, Any]:
+        """Fetch a pagination continuation page from its absolute URL."""
+        self._rate_limit()
+
+        print(f"Requesting next page...")
+        response = self._session.get(
+            next_url, params={'apiKey': self.api_key}, timeout=(3.05, 30)
+        )
+        response.raise_for_status()
+
+        return _parse_response(response)
+
+    def _fetch_all_results(self, endpoint: str, params: Dict[str, Any],
+                           ttl: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch a result set, following next_url pagination to completion.
+
+        The merged result list (not the individual pages) is what gets
+        cached, so cache hits skip every page.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            ttl: Cache lifetime in seconds (None disables caching)
+
+        Returns:
+            All result records across pages
+        """
+        cache_path = None
+        if ttl is not None and self.cache_dir:
+            cache_path = self._cache_path(endpoint, params)
+            cached = self._cache_read(cache_path, ttl)
+            if cached is not None:
+                return cached['results']
+
+        data = self._make_request(endpoint, params)
+        results = list(data.get('results', []))
+
+        while data.get('next_url'):
+            data = self._get_next(data['next_url'])
+            results.extend(data.get('results', []))
+
+        if cache_path is not None:
+            self._cache_write(cache_path, {'results': results})
+
+        return results
 
     def get_dividends(
         self,
@@ -90,8 +251,77 @@ class PolygonClient:
         if end_date:
             params['ex_dividend_date.lte'] = end_date
 
-        data = self._make_request(endpoint, params)
-        return data.get('results', [])
+        return self._fetch_all_results(endpoint, params, ttl=TTL_DIVIDENDS)
+
+    def get_dividends_bulk(
+        self,
+        tickers: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get dividend history for many tickers in a single filtered call.
+
+        Uses the ticker.any_of filter so N tickers cost one rate-limited
+        request instead of N.
+
+        Args:
+            tickers: Stock ticker symbols
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+
+        Returns:
+            Dictionary mapping each ticker to its dividend records
+        """
+        endpoint = "/v3/reference/dividends"
+        params = {
+            'ticker.any_of': ','.join(tickers),
+            'limit': 1000
+        }
+
+        if start_date:
+            params['ex_dividend_date.gte'] = start_date
+        if end_date:
+            params['ex_dividend_date.lte'] = end_date
+
+        results = self._fetch_all_results(endpoint, params, ttl=TTL_DIVIDENDS)
+
+        by_ticker: Dict[str, List[Dict[str, Any]]] = {t: [] for t in tickers}
+        for record in results:
+            by_ticker.setdefault(record.get('ticker'), []).append(record)
+        return by_ticker
+
+    def fetch_symbol_bundle(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str
+    ) -> tuple:
+        """
+        Fetch dividends and daily price bars for a ticker concurrently.
+
+        The two requests are independent, so issue them together and let
+        the token bucket decide whether they burst or pace, instead of
+        serializing two full rate-limit waits.
+
+        Args:
+            ticker: Stock ticker symbol
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Tuple of (dividends, prices)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dividends = executor.submit(
+                self.get_dividends, ticker, start_date, end_date
+            )
+            prices = executor.submit(
+                self.get_aggregates, ticker,
+                multiplier=1, timespan='day',
+                from_date=start_date, to_date=end_date
+            )
+            return dividends.result(), prices.result()
 
     def get_aggregates(
         self,
@@ -121,5 +351,9 @@ class PolygonClient:
             'limit': 50000
         }
 
-        data = self._make_request(endpoint, params)
-        return data.get('results', [])
+        # Bars for fully past windows are immutable; only windows that
+        # reach into today need a short TTL
+        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        ttl = TTL_HISTORICAL_BARS if to_date and to_date < yesterday else TTL_RECENT_BARS
+
+        return self._fetch_all_results(endpoint, params, ttl=ttl)
@@ -3,15 +3,31 @@
 Graphical visualization for dividend and price analysis.
 Creates charts and tables using matplotlib.
 """
-import matplotlib.pyplot as plt
 import numpy as np
+from functools import lru_cache
 from typing import List, Dict
-from report_data import collect_report_data
+from matplotlib import rcParams
+from matplotlib.colors import to_rgba
+
+# The Agg backend and the data pipeline (yaml/pandas via report_data)
+# are imported inside main(): they are the bulk of the script's cold
+# start and are only needed when actually rendering
 
 # Configure font fallback: DejaVu Sans for regular text (supports bold),
 # Apple Symbols for Unicode circled characters
-plt.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Apple Symbols', 'Helvetica', 'Arial']
-plt.rcParams['font.family'] = 'sans-serif'
+rcParams['font.sans-serif'] = ['DejaVu Sans', 'Apple Symbols', 'Helvetica', 'Arial']
+rcParams['font.family'] = 'sans-serif'
+
+# Draw-speed tuning: aggressive path simplification keeps the sparkline
+# polylines cheap to rasterize, an ASCII minus skips the unicode glyph
+# lookup in tick labels, and font hinting is pointless at these sizes
+rcParams.update({
+    'axes.unicode_minus': False,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'text.hinting': 'none',
+})
 
 
 def get_frequency_icon(freq: str) -> str:
@@ -19,6 +35,59 @@ def get_frequency_icon(freq: str) -> str:
     return freq  # Just return M, W, or Q
 
 
+# Cell formatters live at module scope (rather than as per-row closures)
+# and memoize their output: across a table most cells repeat the same
+# rounded values ('N/A', '+0.0%', 'GAIN'), so the f-string work runs
+# once per distinct value instead of once per cell.
+
+@lru_cache(maxsize=4096)
+def fmt_pct(v):
+    if v is None:
+        return 'N/A'
+    return f"{v:+.1f}%" if v != 'N/A' else 'N/A'
+
+
+@lru_cache(maxsize=4096)
+def fmt_dollars(v, yield_pct=None):
+    if v is None:
+        return 'N/A'
+    if yield_pct is None:
+        return f"${v:.1f}" if v != 'N/A' else 'N/A'
+    return f"${v:.1f} ({yield_pct:.1f}%)" if v != 'N/A' and yield_pct is not None else 'N/A'
+
+
+@lru_cache(maxsize=4096)
+def fmt_profit(v):
+    if v is None:
+        return 'N/A'
+    return 'GAIN' if v else 'LOSS'
+
+
+# Column layout of the summary table: which table column holds which
+# metric for each period. The value-driven styling passes iterate these
+# instead of spelling out one branch per period x column.
+PRICE_COLS = (('3m', 1), ('6m', 5), ('12m', 9))
+TOTAL_COLS = (('3m', 3), ('6m', 7), ('12m', 11))
+RESULT_COLS = (('3m', 4), ('6m', 8), ('12m', 12))
+
+# Table palette, pre-parsed to RGBA once: passing tuples to
+# set_facecolor/set_color skips matplotlib's per-cell string parse
+GREEN = to_rgba('#008000')
+RED = to_rgba('#FF0000')
+WHITE = to_rgba('white')
+HEADER_BG = to_rgba('#40466e')
+SYMBOL_BG = to_rgba('#f0f0f0')
+MINT_BG = to_rgba('#E6FFF0')      # 3 month group
+BLUE_BG = to_rgba('#E6F3FF')      # 6 month group
+YELLOW_BG = to_rgba('#FFF9E6')    # 12 month group
+GROUP_BG = (SYMBOL_BG,) + (MINT_BG,) * 4 + (BLUE_BG,) * 4 + (YELLOW_BG,) * 4
+
+# Loss/gain colors indexed by (value > 0) for vectorized selection
+GAIN_LOSS = np.empty(2, dtype=object)
+GAIN_LOSS[0] = RED
+GAIN_LOSS[1] = GREEN
+
+
 def create_summary_table(ax, table_data: List[Dict]):
     """
     Create a summary table with key metrics.
@@ -43,42 +112,21 @@ def create_summary_table(ax, table_data: List[Dict]):
     rows.append(headers_bottom)
 
     for item in table_data:
-        def fmt_pct(v):
-            if v is None:
-                return 'N/A'
-            return f"{v:+.1f}%" if v != 'N/A' else 'N/A'
-
-        def fmt_dollars(v, yield_pct=None):
-            if v is None:
-                return 'N/A'
-            if yield_pct is None:
-                return f"${v:.1f}" if v != 'N/A' else 'N/A'
-            return f"${v:.1f} ({yield_pct:.1f}%)" if v != 'N/A' and yield_pct is not None else 'N/A'
-
-        def fmt_profit(v):
-            if v is None:
-                return 'N/A'
-            return 'GAIN' if v else 'LOSS'
-
         # Format symbol with frequency indicator (right-aligned with spacing)
         freq_icon = get_frequency_icon(item.get('dividend_frequency', ''))
         symbol_text = f"{item['symbol']}     {freq_icon}" if freq_icon else item['symbol']
 
-        row = [
-            symbol_text,
-            fmt_pct(item['3m']['price_change_pct']),
-            fmt_dollars(item['3m']['total_dividends'], item['3m']['dividend_yield_pct']),
-            fmt_pct(item['3m']['total_return_pct']),
-            fmt_profit(item['3m']['profitable_total']),
-            fmt_pct(item['6m']['price_change_pct']),
-            fmt_dollars(item['6m']['total_dividends'], item['6m']['dividend_yield_pct']),
-            fmt_pct(item['6m']['total_return_pct']),
-            fmt_profit(item['6m']['profitable_total']),
-            fmt_pct(item['12m']['price_change_pct']),
-            fmt_dollars(item['12m']['total_dividends'], item['12m']['dividend_yield_pct']),
-            fmt_pct(item['12m']['total_return_pct']),
-            fmt_profit(item['12m']['profitable_total'])
-        ]
+        # Bind the period dicts once rather than chaining lookups per cell
+        m3, m6, m12 = item['3m'], item['6m'], item['12m']
+
+        row = [symbol_text]
+        for metrics in (m3, m6, m12):
+            row.extend((
+                fmt_pct(metrics['price_change_pct']),
+                fmt_dollars(metrics['total_dividends'], metrics['dividend_yield_pct']),
+                fmt_pct(metrics['total_return_pct']),
+                fmt_profit(metrics['profitable_total']),
+            ))
         rows.append(row)
 
     # Create table without colLabels since we're including them in the data
@@ -87,140 +135,76 @@ def create_summary_table(ax, table_data: List[Dict]):
     table.set_fontsize(9)
     table.scale(1, 1.5)
 
-    # Style period label row (row 0 - first data row)
-    for i in range(len(headers_top)):
-        table[(0, i)].set_text_props(weight='bold', fontsize=10)
-        # Set background colors matching the column groups
-        if i == 0:  # Symbol column
-            table[(0, i)].set_facecolor('#f0f0f0')
-            # Only hide text if empty
-            if headers_top[i] == '':
-                table[(0, i)].set_text_props(color='#f0f0f0')
-            else:
-                # Make font smaller in first cell to fit legend text
-                table[(0, i)].set_text_props(fontsize=7)
-        elif 1 <= i <= 4:  # 3 month
-            table[(0, i)].set_facecolor('#E6FFF0')
-            if headers_top[i] == '':
-                table[(0, i)].set_text_props(color='#E6FFF0')
-        elif 5 <= i <= 8:  # 6 month
-            table[(0, i)].set_facecolor('#E6F3FF')
-            if headers_top[i] == '':
-                table[(0, i)].set_text_props(color='#E6F3FF')
-        else:  # 9-12, 12 month
-            table[(0, i)].set_facecolor('#FFF9E6')
-            if headers_top[i] == '':
-                table[(0, i)].set_text_props(color='#FFF9E6')
-
-    # Style metric label row (row 1)
-    for i in range(len(headers_bottom)):
-        table[(1, i)].set_facecolor('#40466e')
-        table[(1, i)].set_text_props(weight='bold', color='white', fontsize=8)
-
-    # Set background colors for column groups (data starts at row 2)
-    for i in range(2, len(rows)):
-        # Right-align symbol column (column 0)
-        table[(i, 0)].set_text_props(ha='right')
-
-        # 3m columns (1-4): light mint background
-        for col in [1, 2, 3, 4]:
-            table[(i, col)].set_facecolor('#E6FFF0')
-
-        # 6m columns (5-8): light blue background
-        for col in [5, 6, 7, 8]:
-            table[(i, col)].set_facecolor('#E6F3FF')
-
-        # 12m columns (9-12): light yellow background
-        for col in [9, 10, 11, 12]:
-            table[(i, col)].set_facecolor('#FFF9E6')
-
-    # Style frequency indicators in symbol column with different colors
-    freq_colors = {'M': '#0066CC', 'W': '#CC6600', 'Q': '#009900'}
-    for i, item in enumerate(table_data, start=2):
-        freq = item.get('dividend_frequency', '')
-        if freq and freq in freq_colors:
-            # Get the cell text and split to style the frequency part
-            cell = table[(i, 0)]
-            # Note: matplotlib doesn't support multi-color text in one cell easily
-            # So we'll just make the whole symbol cell slightly colored
-            pass
-
-    # Color code cells based on values (data starts at row 2 now)
-    for i, item in enumerate(table_data, start=2):
-        # Color GAIN/LOSS text for all periods
-        # 3m Result (column 4)
-        if item['3m']['profitable_total'] is not None:
-            color = '#008000' if item['3m']['profitable_total'] else '#FF0000'
-            table[(i, 4)].get_text().set_color(color)
-            table[(i, 4)].get_text().set_weight('bold')
-
-        # 6m Result (column 8)
-        if item['6m']['profitable_total'] is not None:
-            color = '#008000' if item['6m']['profitable_total'] else '#FF0000'
-            table[(i, 8)].get_text().set_color(color)
-            table[(i, 8)].get_text().set_weight('bold')
-
-        # 12m Result (column 12)
-        if item['12m']['profitable_total'] is not None:
-            color = '#008000' if item['12m']['profitable_total'] else '#FF0000'
-            table[(i, 12)].get_text().set_color(color)
-            table[(i, 12)].get_text().set_weight('bold')
-
-        # Color price change cells
-        # 3m Price Δ (column 1)
-        if item['3m']['price_change_pct'] is not None:
-            if item['3m']['price_change_pct'] > 0:
-                table[(i, 1)].get_text().set_color('#008000')
-                table[(i, 1)].get_text().set_weight('bold')
-            elif item['3m']['price_change_pct'] < 0:
-                table[(i, 1)].get_text().set_color('#FF0000')
-                table[(i, 1)].get_text().set_weight('bold')
-
-        # 6m Price Δ (column 5)
-        if item['6m']['price_change_pct'] is not None:
-            if item['6m']['price_change_pct'] > 0:
-                table[(i, 5)].get_text().set_color('#008000')
-                table[(i, 5)].get_text().set_weight('bold')
-            elif item['6m']['price_change_pct'] < 0:
-                table[(i, 5)].get_text().set_color('#FF0000')
-                table[(i, 5)].get_text().set_weight('bold')
-
-        # 12m Price Δ (column 9)
-        if item['12m']['price_change_pct'] is not None:
-            if item['12m']['price_change_pct'] > 0:
-                table[(i, 9)].get_text().set_color('#008000')
-                table[(i, 9)].get_text().set_weight('bold')
-            elif item['12m']['price_change_pct'] < 0:
-                table[(i, 9)].get_text().set_color('#FF0000')
-                table[(i, 9)].get_text().set_weight('bold')
-
-        # Color total return cells
-        # 3m Total (column 3)
-        if item['3m']['total_return_pct'] is not None:
-            if item['3m']['total_return_pct'] > 0:
-                table[(i, 3)].get_text().set_color('#008000')
-                table[(i, 3)].get_text().set_weight('bold')
-            elif item['3m']['total_return_pct'] < 0:
-                table[(i, 3)].get_text().set_color('#FF0000')
-                table[(i, 3)].get_text().set_weight('bold')
-
-        # 6m Total (column 7)
-        if item['6m']['total_return_pct'] is not None:
-            if item['6m']['total_return_pct'] > 0:
-                table[(i, 7)].get_text().set_color('#008000')
-                table[(i, 7)].get_text().set_weight('bold')
-            elif item['6m']['total_return_pct'] < 0:
-                table[(i, 7)].get_text().set_color('#FF0000')
-                table[(i, 7)].get_text().set_weight('bold')
-
-        # 12m Total (column 11)
-        if item['12m']['total_return_pct'] is not None:
-            if item['12m']['total_return_pct'] > 0:
-                table[(i, 11)].get_text().set_color('#008000')
-                table[(i, 11)].get_text().set_weight('bold')
-            elif item['12m']['total_return_pct'] < 0:
-                table[(i, 11)].get_text().set_color('#FF0000')
-                table[(i, 11)].get_text().set_weight('bold')
+    # Decide every cell's appearance up front in property matrices, then
+    # apply them in a single traversal that touches each Cell exactly
+    # once — every set_* call invalidates the artist, so overlapping
+    # styling passes multiply the cost.
+    n_rows = len(rows)
+    n_cols = len(headers_bottom)
+    facecolors = np.empty((n_rows, n_cols), dtype=object)
+    text_colors = np.empty((n_rows, n_cols), dtype=object)
+    bold = np.zeros((n_rows, n_cols), dtype=bool)
+    fontsizes = np.zeros((n_rows, n_cols), dtype=np.int8)
+
+    # Row 0: period labels over their group backgrounds; blank cells
+    # hide their text by matching it to the background
+    bold[0] = True
+    fontsizes[0] = 10
+    fontsizes[0, 0] = 7  # smaller font so the legend text fits
+    for i, header in enumerate(headers_top):
+        facecolors[0, i] = GROUP_BG[i]
+        if header == '':
+            text_colors[0, i] = GROUP_BG[i]
+
+    # Row 1: metric labels, white on dark blue
+    facecolors[1].fill(HEADER_BG)
+    text_colors[1].fill(WHITE)
+    bold[1] = True
+    fontsizes[1] = 8
+
+    # Data rows: group backgrounds everywhere except the symbol column
+    for col in range(1, n_cols):
+        facecolors[2:, col].fill(GROUP_BG[col])
+
+    # Value-driven text colors, vectorized over the symbol axis: green
+    # for gains, red for losses, untouched when zero or missing
+    def metric_column(period, key):
+        return np.fromiter(
+            (np.nan if item[period][key] is None else float(item[period][key])
+             for item in table_data),
+            dtype=np.float64, count=len(table_data))
+
+    for spec, key, skip_zero in (
+        (RESULT_COLS, 'profitable_total', False),
+        (PRICE_COLS, 'price_change_pct', True),
+        (TOTAL_COLS, 'total_return_pct', True),
+    ):
+        for period, col in spec:
+            values = metric_column(period, key)
+            styled = ~np.isnan(values)
+            if skip_zero:
+                styled &= values != 0
+            colors = GAIN_LOSS[(values > 0).astype(np.intp)]
+            text_colors[2:, col] = np.where(styled, colors, None)
+            bold[2:, col] |= styled
+
+    # Single styling pass over all cells; the text properties go through
+    # one Artist.set call per cell instead of separate setters that each
+    # re-validate and re-stale the artist
+    for (r, c), cell in table.get_celld().items():
+        if facecolors[r, c] is not None:
+            cell.set_facecolor(facecolors[r, c])
+        props = {}
+        if c == 0 and r >= 2:
+            props['ha'] = 'right'  # right-align symbols
+        if text_colors[r, c] is not None:
+            props['color'] = text_colors[r, c]
+        if bold[r, c]:
+            props['weight'] = 'bold'
+        if fontsizes[r, c]:
+            props['fontsize'] = fontsizes[r, c]
+        if props:
+            cell.get_text().set(**props)
 
     # Don't add a title - the main figure title is enough
 
@@ -234,33 +218,93 @@ def create_performance_comparison(ax, table_data: List[Dict], period: str = '12m
         table_data: List of symbol data dictionaries
         period: Period to compare ('6m' or '12m')
     """
-    # Create list of tuples and reverse for proper top-to-bottom alphabetical display
-    data = [(item['symbol'],
-             item[period]['total_return_pct'] if item[period]['total_return_pct'] is not None else 0)
-            for item in table_data]
-
-    # Reverse for barh to show alphabetically from top to bottom
-    data_reversed = data[::-1]
-
-    symbols = [d[0] for d in data_reversed]
-    returns = [d[1] for d in data_reversed]
-    colors = ['green' if r > 0 else 'red' for r in returns]
-
-    bars = ax.barh(symbols, returns, color=colors, alpha=0.7)
+    # One pass over the data: reversed arrays (barh shows alphabetical
+    # order top to bottom) and a vectorized color mask
+    symbols = [item['symbol'] for item in table_data][::-1]
+    returns = np.fromiter(
+        (item[period]['total_return_pct'] or 0.0 for item in table_data),
+        dtype=np.float64, count=len(table_data))[::-1]
+    colors = np.where(returns > 0, 'green', 'red')
+
+    ax.barh(symbols, returns, color=colors, alpha=0.7)
     ax.axvline(x=0, color='black', linewidth=0.8)
     ax.set_xlabel('Total Return (%)', fontsize=10)
     ax.set_title(f'{period.upper()} Total Return Comparison', fontweight='bold', fontsize=12)
     ax.grid(axis='x', alpha=0.3)
 
-    # Add value labels
-    for i, (bar, val) in enumerate(zip(bars, returns)):
-        if val != 0:
-            ax.text(val, i, f'{val:+.1f}%', va='center',
-                   ha='left' if val > 0 else 'right', fontsize=8)
+    # Label only the nonzero bars
+    for i in np.flatnonzero(returns):
+        val = returns[i]
+        ax.text(val, i, f'{val:+.1f}%', va='center',
+               ha='left' if val > 0 else 'right', fontsize=8)
+
+
+def render_sparkline(fig, values, expected_days=252):
+    """
+    Draw one price sparkline onto a reusable offscreen figure and
+    return it as an RGBA image.
+
+    Building a full Axes (ticks, grid, locators) per symbol dominates
+    figure construction time; rendering each sparkline on one shared
+    Agg figure and blitting the image into the dashboard pays that cost
+    once.
+
+    Args:
+        fig: Offscreen Figure (with an Agg canvas) reused across calls
+        values: Price values as a float array
+        expected_days: Trading days the x-axis should span
+
+    Returns:
+        RGBA image array of the rendered sparkline
+    """
+    fig.clear()
+    # Leave room on the right for the current-price tag, which sits
+    # just past the line like it did when each symbol had its own Axes
+    ax = fig.add_axes((0.12, 0.06, 0.72, 0.88))
+
+    # Pad with NaN at the beginning if less than ~252 trading days
+    # (12 months, approximated as 21 days/month)
+    padding_needed = max(0, expected_days - values.size)
+    if padding_needed > 0:
+        padded_values = np.concatenate(
+            [np.full(padding_needed, np.nan, dtype=values.dtype), values])
+    else:
+        padded_values = values
+
+    x_indices = np.arange(len(padded_values))
+    ax.plot(x_indices, padded_values, linewidth=1, color='#1f77b4')
+
+    # Fill only the valid data area
+    if padding_needed < len(padded_values):
+        ax.fill_between(x_indices[padding_needed:], padded_values[padding_needed:],
+                        alpha=0.3)
+
+    ax.grid(True, alpha=0.3)
+    # No x ticks at all (the labels were hidden anyway), which also
+    # skips the AutoLocator's data-range scan on every draw; y ticks
+    # stay because they carry the price scale
+    ax.set_xticks([])
+    ax.tick_params(labelsize=7)
+    ax.set_xlim(0, expected_days - 1)  # Set consistent x-axis range
+
+    # Add current price, clamped to the xlim so histories longer than
+    # expected_days don't push the tag past the figure's right margin
+    if values.size:
+        tag_x = min(len(padded_values), expected_days) - 1
+        ax.text(tag_x, values[-1], f'${values[-1]:.1f}',
+                fontsize=7, ha='left', va='center',
+                bbox=dict(boxstyle='round,pad=0.2', facecolor='yellow', alpha=0.5))
+
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
 
 
 def main():
     """Main execution function."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from report_data import collect_report_data
+
     print("Loading configuration...")
 
     table_data, metadata = collect_report_data()
@@ -274,101 +318,90 @@ def main():
     num_chart_rows = (len(table_data) + symbols_per_row - 1) // symbols_per_row
 
     # Calculate heights: table needs more space, comparison charts medium, price charts smaller
-    fig = plt.figure(figsize=(24, 8 + 6 + num_chart_rows * 2))
-
-    # Use GridSpec for better control over spacing
-    import matplotlib.gridspec as gridspec
-    gs = gridspec.GridSpec(4 + num_chart_rows, symbols_per_row,
-                           figure=fig,
-                           height_ratios=[4, 1.5, 1.5, 0.3] + [1] * num_chart_rows,
-                           hspace=0.15, wspace=0.3,
-                           top=0.96, bottom=0.02)
+    # Build the Figure directly on an Agg canvas: this script only saves
+    # files, so pyplot's figure registry and GUI backend selection are
+    # pure overhead (and break under headless cron/CI runs)
+    # constrained_layout places everything during the normal draw;
+    # bbox_inches='tight' at save time needed a whole extra render pass
+    # just to measure the artists
+    fig = Figure(figsize=(24, 8 + 6 + num_chart_rows * 2), layout='constrained')
+    FigureCanvasAgg(fig)
+
+    # Lay out every Axes in a single subplot_mosaic call: the table row,
+    # the three comparison charts spanning two columns x two rows each,
+    # the note row, then one named slot per symbol ('.' leaves trailing
+    # slots in the last row empty)
+    comp_row = ['3m', '3m', '6m', '6m', '12m', '12m']
+    mosaic = [['table'] * symbols_per_row, comp_row, comp_row,
+              ['note'] * symbols_per_row]
+    for chart_row in range(num_chart_rows):
+        start = chart_row * symbols_per_row
+        names = [item['symbol']
+                 for item in table_data[start:start + symbols_per_row]]
+        mosaic.append(names + ['.'] * (symbols_per_row - len(names)))
+
+    axd = fig.subplot_mosaic(
+        mosaic,
+        height_ratios=[4, 1.5, 1.5, 0.3] + [1] * num_chart_rows,
+    )
+    fig.get_layout_engine().set(hspace=0.02, wspace=0.05)
 
     analysis_date = metadata.get('analysis_date', '')
     fig.suptitle(f'ETF Dividend & Price Performance Analysis (as of {analysis_date})', fontsize=18, fontweight='bold', y=0.985)
 
-    # Create summary table (row 0, spanning all columns)
-    ax_table = fig.add_subplot(gs[0, :])
-    create_summary_table(ax_table, table_data)
-
-    # Create comparison charts (row 1 and 2, split in thirds)
-    # 3m, 6m, and 12m to align with table above
-    ax_comp_3m = fig.add_subplot(gs[1:3, :2])
-    create_performance_comparison(ax_comp_3m, table_data, '3m')
+    # Summary table spanning the top row
+    create_summary_table(axd['table'], table_data)
 
-    ax_comp_6m = fig.add_subplot(gs[1:3, 2:4])
-    create_performance_comparison(ax_comp_6m, table_data, '6m')
+    # Comparison charts aligned with the table's period groups
+    create_performance_comparison(axd['3m'], table_data, '3m')
+    create_performance_comparison(axd['6m'], table_data, '6m')
+    create_performance_comparison(axd['12m'], table_data, '12m')
 
-    ax_comp_12m = fig.add_subplot(gs[1:3, 4:])
-    create_performance_comparison(ax_comp_12m, table_data, '12m')
-
-    # Add note about price chart timeframe in spacer row 3
-    ax_note = fig.add_subplot(gs[3, :])
+    # Note about price chart timeframe in the spacer row
+    ax_note = axd['note']
     ax_note.axis('off')
     ax_note.text(0.5, 0.2, '12-Month Price History (most recent closing price shown)',
                 ha='center', va='top', fontsize=10, style='italic', color='#666666')
 
-    # Create price charts starting from row 4 (after spacer row 3)
-    for idx, item in enumerate(table_data):
-        row = (idx // symbols_per_row) + 4
-        col = idx % symbols_per_row
+    # Offscreen figure shared by all sparkline renders, sized to match
+    # the aspect of one grid slot
+    fig_spark = Figure(figsize=(3.8, 1.9), dpi=100)
+    FigureCanvasAgg(fig_spark)
 
-        ax = fig.add_subplot(gs[row, col])
+    # Fill the per-symbol price chart slots
+    for item in table_data:
+        ax = axd[item['symbol']]
+        ax.set_title(item['symbol'], fontweight='bold', fontsize=9)
 
-        # Get price history
         prices = item.get('price_history', [])
         if not prices:
+            # A bare turned-off Axes keeps the placeholder in its slot;
+            # a figure-level label would need post-layout coordinates
             ax.text(0.5, 0.5, 'No Data', ha='center', va='center', fontsize=8)
-            ax.set_title(item['symbol'], fontweight='bold', fontsize=9)
             ax.axis('off')
             continue
 
-        values = [np.nan if p[1] is None else float(p[1]) for p in prices]
-
-        # Pad with NaN at the beginning if less than ~252 trading days (12 months)
-        # Approximate 12 months as 252 trading days (21 days/month * 12)
-        expected_days = 252
-        padding_needed = max(0, expected_days - len(values))
-
-        if padding_needed > 0:
-            padded_values = np.array([np.nan] * padding_needed + values, dtype=float)
-            first_valid_idx = padding_needed
-        else:
-            padded_values = np.array(values, dtype=float)
-            first_valid_idx = 0
-
-        x_indices = np.arange(len(padded_values))
-
-        # Plot
-        ax.plot(x_indices, padded_values, linewidth=1, color='#1f77b4')
-
-        # Fill only the valid data area
-        if first_valid_idx < len(padded_values):
-            valid_x = x_indices[first_valid_idx:]
-            valid_y = padded_values[first_valid_idx:]
-            ax.fill_between(valid_x, valid_y, alpha=0.3)
-
-        # Style - add frequency indicator to title
-        title_text = item['symbol']
-        ax.set_title(title_text, fontweight='bold', fontsize=9)
-        ax.grid(True, alpha=0.3)
-        ax.tick_params(axis='x', labelbottom=False)
-        ax.tick_params(labelsize=7)
-        ax.set_xlim(0, expected_days - 1)  # Set consistent x-axis range
-
-        # Add current price
-        if values:
-            ax.text(len(padded_values)-1, values[-1], f'${values[-1]:.1f}',
-                   fontsize=7, ha='left', va='center',
-                   bbox=dict(boxstyle='round,pad=0.2', facecolor='yellow', alpha=0.5))
-
-    # Save figure
-    output_file = 'dividend_analysis.png'
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
-    print(f"\n✅ Visualization saved to: {output_file}")
+        # float32 is plenty for plotting and halves the memory traffic
+        # through the draw path versus float64
+        values = np.fromiter(
+            (np.nan if p[1] is None else p[1] for p in prices),
+            dtype=np.float32, count=len(prices)
+        )
+
+        ax.imshow(render_sparkline(fig_spark, values), aspect='auto')
+        ax.axis('off')
 
-    # Show plot
-    plt.show()
+    # Save figure: SVG is the primary output — the table and bar charts
+    # stay vector (no Agg rasterization of the full-size figure, sharper
+    # text) while the sparklines are already compact raster images
+    svg_file = 'dividend_analysis.svg'
+    fig.savefig(svg_file)
+
+    # Keep the PNG for consumers that need a bitmap; dpi=100 renders
+    # less than half the pixels of the previous dpi=150
+    output_file = 'dividend_analysis.png'
+    fig.savefig(output_file, dpi=100)
+    print(f"\n✅ Visualization saved to: {svg_file} and {output_file}")
 
     print("\n📊 Graphical analysis complete!")
 
@@ -2,18 +2,24 @@
 """Shared utilities for preparing dividend report data."""
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from analyzer import DividendAnalyzer
-from data_manager import DataManager
+from data_manager import DataManager, read_json, write_json
+from symbols_util import normalize_symbols
 
 
+@lru_cache(maxsize=4)
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
-    """Load configuration from a YAML file."""
+    """Load configuration from a YAML file (parsed once per process)."""
     path = Path(config_path)
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
@@ -22,6 +28,75 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
         return yaml.safe_load(handle)
 
 
+@lru_cache(maxsize=4)
+def _get_data_manager(data_directory: str) -> DataManager:
+    """Share one DataManager per data directory within a process."""
+    return DataManager(data_directory)
+
+
+def analyze_symbol(
+    data_directory: str,
+    symbol: str,
+    use_cache: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """Load and analyze a single symbol.
+
+    Module-level (picklable) so collect_report_data can fan it out to
+    worker processes. Results are cached on disk keyed by the mtimes of
+    the symbol's data files, so unchanged symbols skip the analyzer
+    entirely on rebuilds.
+
+    Args:
+        data_directory: Directory holding the cached data files.
+        symbol: Ticker symbol to analyze.
+        use_cache: If False, always recompute and skip the result cache.
+
+    Returns:
+        The per-symbol metric dictionary, or None when no price data exists.
+    """
+    data_manager = _get_data_manager(data_directory)
+
+    fingerprint = data_manager.data_fingerprint(symbol)
+    cache_path = Path(data_directory) / ".cache" / f"{symbol}.json"
+
+    if use_cache and cache_path.exists():
+        try:
+            cached = read_json(cache_path)
+        except ValueError:
+            cached = None
+        if cached and cached.get("fingerprint") == fingerprint:
+            return cached["result"]
+
+    dividends = data_manager.load_dividends(symbol)
+    prices = data_manager.load_prices(symbol)
+
+    if not prices:
+        result = None
+    else:
+        analyzer = DividendAnalyzer(dividends, prices)
+
+        metrics = analyzer.calculate_metrics_multi([3, 6, 12])
+        price_history = analyzer.get_price_history(months=12)
+        dividend_freq = analyzer.get_dividend_frequency()
+
+        result = {
+            "symbol": symbol,
+            "price_history": price_history,
+            "dividend_frequency": dividend_freq,
+            "dividends": dividends,
+            "3m": metrics[3],
+            "6m": metrics[6],
+            "12m": metrics[12],
+        }
+
+    if use_cache:
+        cache_path.parent.mkdir(exist_ok=True)
+        write_json(cache_path, {"fingerprint": fingerprint, "result": result},
+                   pretty=False)
+
+    return result
+
+
 def collect_report_data(
     config_path: str = "config.yaml",
     silent: bool = False,
@@ -39,45 +114,31 @@ def collect_report_data(
     """
     config = load_config(config_path)
 
-    data_manager = DataManager(config["data_directory"])
+    symbols, _ = normalize_symbols(config["symbols"])
 
     table_data: List[Dict[str, Any]] = []
     skipped_symbols: List[str] = []
 
     run_timestamp = datetime.now()
 
-    for symbol in config["symbols"]:
-        if not silent:
-            print(f"Processing {symbol}...")
-
-        dividends = data_manager.load_dividends(symbol)
-        prices = data_manager.load_prices(symbol)
-
-        if not prices:
+    # Per-symbol analysis is independent and CPU-bound, so fan it out
+    # across worker processes; map() preserves symbol order.
+    max_workers = min(len(symbols), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            analyze_symbol, repeat(config["data_directory"]), symbols
+        )
+        for symbol, result in zip(symbols, results):
             if not silent:
-                print(f"  No price data for {symbol}, skipping...")
-            skipped_symbols.append(symbol)
-            continue
+                print(f"Processing {symbol}...")
 
-        analyzer = DividendAnalyzer(dividends, prices)
+            if result is None:
+                if not silent:
+                    print(f"  No price data for {symbol}, skipping...")
+                skipped_symbols.append(symbol)
+                continue
 
-        metrics_3m = analyzer.calculate_metrics(months=3)
-        metrics_6m = analyzer.calculate_metrics(months=6)
-        metrics_12m = analyzer.calculate_metrics(months=12)
-        price_history = analyzer.get_price_history(months=12)
-        dividend_freq = analyzer.get_dividend_frequency()
-
-        table_data.append(
-            {
-                "symbol": symbol,
-                "price_history": price_history,
-                "dividend_frequency": dividend_freq,
-                "dividends": dividends,
-                "3m": metrics_3m,
-                "6m": metrics_6m,
-                "12m": metrics_12m,
-            }
-        )
+            table_data.append(result)
 
     table_data.sort(key=lambda item: item["symbol"])
 
@@ -0,0 +1,46 @@
+"""Shared normalization of the configured symbol list."""
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+def normalize_symbols(
+    symbols_config: Iterable[Any],
+) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """Normalize config symbol entries into a canonical ticker list.
+
+    Both the fetch and report paths read config["symbols"], so the
+    accepted shapes are defined once here: entries may be plain strings
+    ("SCHD") or mappings carrying extra attributes under a 'symbol' key
+    ({symbol: SCHD, note: ...}).
+
+    Args:
+        symbols_config: The raw symbols entry from the config file.
+
+    Returns:
+        A tuple of (symbols, attributes) where symbols is the
+        deduplicated upper-case ticker list in config order and
+        attributes maps tickers to any extra keys from mapping entries.
+    """
+    symbols: List[str] = []
+    attributes: Dict[str, Dict[str, Any]] = {}
+    seen = set()
+
+    for entry in symbols_config or []:
+        if isinstance(entry, str):
+            symbol = entry
+            extra: Dict[str, Any] = {}
+        elif isinstance(entry, dict) and 'symbol' in entry:
+            symbol = entry['symbol']
+            extra = {k: v for k, v in entry.items() if k != 'symbol'}
+        else:
+            raise ValueError(f"Unsupported symbols entry in config: {entry!r}")
+
+        symbol = symbol.strip().upper()
+        if not symbol or symbol in seen:
+            continue
+
+        seen.add(symbol)
+        symbols.append(symbol)
+        if extra:
+            attributes[symbol] = extra
+
+    return symbols, attributes